@@ -14,15 +14,16 @@ class TranslatedAttribute(object):
     """ Proxy descriptor, forwarding attribute access to loaded translation.
         If no translation is loaded, it will attempt to load one depending on settings
     """
+    __slots__ = ('translations_model', 'name', '_NoTranslationError')
 
-    def __init__(self, model, name, query_field):
-        """ Initialize translated attribute {name} on the given {model} """
+    def __init__(self, model, name, no_translation_error):
+        """ Initialize translated attribute {name} on the given {model}
+            no_translation_error is the exception class raised when no translation
+            can be loaded, shared by all translated attributes of the model.
+        """
         self.translations_model = model._meta.translations_model
         self.name = name
-        self.query_field = query_field
-        self._NoTranslationError = type('NoTranslationError',
-                                        (AttributeError, model._meta.translations_model.DoesNotExist),
-                                        {})
+        self._NoTranslationError = no_translation_error
         super(TranslatedAttribute, self).__init__()
 
     def load_translation(self, instance):
@@ -37,12 +38,12 @@ class TranslatedAttribute(object):
                                 'settings.HVAD[\'AUTOLOAD_TRANSLATIONS\'] is False' % self.name)
         try:
             translation = get_translation(instance)
-        except instance._meta.translations_model.DoesNotExist:
+        except self.translations_model.DoesNotExist:
             raise self._NoTranslationError('Accessing a translated field requires that '
                                         'the instance has a translation loaded, or a '
                                         'valid translation in current language (%s) '
                                         'loadable from the database' % get_language())
-        self.query_field.set_cached_value(instance, translation)
+        instance._hvad_translation = translation
         return translation
 
     def __get__(self, instance, instance_type=None):
@@ -50,37 +51,60 @@ class TranslatedAttribute(object):
             if not registry.apps.ready: #pragma: no cover
                 raise AttributeError('Attribute not available until registry is ready.')
             return self.translations_model._meta.get_field(self.name).default
-        try:
-            translation = self.query_field.get_cached_value(instance)
-        except KeyError:
+        translation = instance._hvad_translation
+        if translation is None:
             translation = self.load_translation(instance)
         return getattr(translation, self.name)
     
     def __set__(self, instance, value):
-        try:
-            translation = self.query_field.get_cached_value(instance)
-        except KeyError:
+        translation = instance._hvad_translation
+        if translation is None:
             translation = self.load_translation(instance)
         setattr(translation, self.name, value)
     
     def __delete__(self, instance):
-        try:
-            translation = self.query_field.get_cached_value(instance)
-        except KeyError:
+        translation = instance._hvad_translation
+        if translation is None:
             translation = self.load_translation(instance)
         delattr(translation, self.name)
 
 #===============================================================================
 
+class PendingTranslationAttribute(object):
+    """ Class-level default for the translation cache of instances.
+        When an instance is initialized with a language but no translated values,
+        __init__ only stores the language, and the empty translation is built on
+        first access. Once built or set, the translation lives in the instance
+        __dict__ and this descriptor is no longer used.
+        Shallow copies made before that first access build separate translations.
+    """
+    __slots__ = ()
+
+    def __get__(self, instance, instance_type=None):
+        if instance is None:
+            return self
+        # pending language may legitimately be None, test for the key itself
+        try:
+            language_code = instance.__dict__.pop('_hvad_pending_translation')
+        except KeyError:
+            translation = None
+        else:
+            translation = instance._meta.translations_model(language_code=language_code)
+        instance.__dict__['_hvad_translation'] = translation
+        return translation
+
+#===============================================================================
+
 class LanguageCodeAttribute(object):
     """
     The language_code attribute is different from other attribtues as:
         - it cannot be set nor deleted. Trying to do so raises an attribute error.
         - it never auto-loads a translation, but returns None if no translation is cached
     """
-    def __init__(self, model, query_field):
+    __slots__ = ('translations_model',)
+
+    def __init__(self, model):
         self.translations_model = model._meta.translations_model
-        self.query_field = query_field
         super(LanguageCodeAttribute, self).__init__()
 
     def __get__(self, instance, instance_type=None):
@@ -88,10 +112,8 @@ class LanguageCodeAttribute(object):
             if not registry.apps.ready: #pragma: no cover
                 raise AttributeError('Attribute not available until registry is ready.')
             return self.translations_model._meta.get_field('language_code').default
-        try:
-            return self.query_field.get_cached_value(instance).language_code
-        except KeyError:
-            return None
+        translation = instance._hvad_translation
+        return None if translation is None else translation.language_code
 
     def __set__(self, instance, value):
         raise AttributeError("The 'language_code' attribute cannot be changed directly.")
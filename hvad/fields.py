@@ -5,6 +5,7 @@ import django
 from django.apps import apps
 from django.db import models
 from django.db.models.expressions import Expression, Col, Value
+from django.db.models.fields import NOT_PROVIDED
 from django.db.models.fields.related import ForeignObject, ReverseManyToOneDescriptor
 from django.utils import translation
 from django.utils.functional import cached_property
@@ -148,6 +149,27 @@ class SingleTranslationObject(ForeignObject):
         super(SingleTranslationObject, self).contribute_to_class(cls, name, False)
         delattr(cls, self.name)
 
+    # The loaded translation is cached in the instance's _hvad_translation
+    # attribute rather than in _state.fields_cache, so it can be read directly.
+    # It defaults to None, or to a pending translation built on first access.
+
+    def get_cached_value(self, instance, default=NOT_PROVIDED):
+        translation = instance._hvad_translation
+        if translation is None:
+            if default is NOT_PROVIDED:
+                raise KeyError(self.get_cache_name())
+            return default
+        return translation
+
+    def is_cached(self, instance):
+        return instance._hvad_translation is not None
+
+    def set_cached_value(self, instance, value):
+        instance._hvad_translation = value
+
+    def delete_cached_value(self, instance):
+        instance._hvad_translation = None
+
     def deconstruct(self):
         """ Let the field work nicely with migrations """
         name, path, args, kwargs = super(SingleTranslationObject, self).deconstruct()
@@ -219,8 +241,7 @@ class TranslationsAccessor(ReverseManyToOneDescriptor):
                 """ Direct reference to the translation currently cached on instance.
                     Thus, obj.translations.active is equivalent to get_cached_translation(obj)
                 """
-                instance = self.instance
-                return instance._meta.get_field('_hvad_query').get_cached_value(instance, None)
+                return self.instance._hvad_translation
 
             def get_language(self, language):
                 """ Return the translation for given language.
@@ -82,7 +82,7 @@ class TranslatableModelIterable(ModelIterable):
                     delattr(obj, name)
 
             # Load translation and swap to shared model
-            obj.master._meta.get_field('_hvad_query').set_cached_value(obj.master, obj)
+            obj.master._hvad_translation = obj
             obj = obj.master
             if qs.shared_model._meta.proxy:
                 obj.__class__ = qs.shared_model
@@ -615,6 +615,7 @@ class TranslationManager(models.Manager):
     queryset_class = TranslationQueryset
     fallback_class = QuerySet
     default_class = TranslationQueryset if hvad_settings.USE_DEFAULT_QUERYSET else QuerySet
+    _is_translation_manager = True
 
     def __init__(self, *args, **kwargs):
         self.queryset_class = kwargs.pop('queryset_class', self.queryset_class)
@@ -2,24 +2,25 @@
 """
 import django
 from django.core import checks
-from django.core.exceptions import ImproperlyConfigured, FieldDoesNotExist
+from django.core.exceptions import ImproperlyConfigured
 from django.db import models, router, transaction
 from django.db.models.base import ModelBase
 from django.db.models.manager import Manager
 from django.db.models.signals import class_prepared
 from django.utils.translation import get_language
-from hvad.descriptors import LanguageCodeAttribute, TranslatedAttribute
+from hvad.descriptors import (LanguageCodeAttribute, TranslatedAttribute,
+                              PendingTranslationAttribute)
 from hvad.fields import SingleTranslationObject, MasterKey
 from hvad.manager import TranslationManager
 from hvad.settings import hvad_settings
-from hvad.utils import get_cached_translation, set_cached_translation, SmartGetField
-from types import MethodType
+from hvad.utils import get_cached_translation, set_cached_translation, install_smart_options
 from itertools import chain
 import sys
 
 __all__ = ('TranslatableModel', 'TranslatedFields', 'NoTranslation')
 
 forbidden_translated_fields = ('Meta', 'objects', 'master', 'master_id')
+translation_clean_exclude = ('id', 'master', 'master_id', 'language_code')
 
 #===============================================================================
 
@@ -29,6 +30,7 @@ NoTranslation = object()
 
 class TranslatedFields(object):
     """ Wrapper class to define translated fields on a model. """
+    __slots__ = ('meta', 'base_class', 'fields')
 
     def __init__(self, meta=None, base_class=None, **fields):
         forbidden = set(forbidden_translated_fields).intersection(fields)
@@ -41,17 +43,22 @@ class TranslatedFields(object):
 
     @staticmethod
     def _split_together(constraints, fields, name):
+        """ Split constraints into shared and translated ones.
+            constraints -- sequence of field name tuples
+            fields -- frozenset of translated field names
+            Returns a (shared, translated) pair of tuples.
+        """
         sconst, tconst = [], []
         for constraint in constraints:
-            if all(item in fields for item in constraint):
+            if fields.issuperset(constraint):
                 tconst.append(constraint)
-            elif not any(item in fields for item in constraint):
+            elif fields.isdisjoint(constraint):
                 sconst.append(constraint)
             else:
                 raise ImproperlyConfigured(
                     'Constraints in Meta.%s cannot mix translated and '
                     'untranslated fields, such as %r.' % (name, constraint))
-        return sconst, tconst
+        return tuple(sconst), tuple(tconst)
 
     def contribute_to_class(self, model, name):
         if model._meta.order_with_respect_to in self.fields:
@@ -112,33 +119,52 @@ class TranslatedFields(object):
 
     def _scan_model_bases(self, model):
         """ Scan the model class' bases, collecting translated fields """
-        bases, fields = list(), set()
-        scan_bases = list(reversed(model.__bases__))
-        while scan_bases:
-            base = scan_bases.pop()
-            if base is TranslatableModel or not issubclass(base, TranslatableModel):
-                continue
-            if not base._meta.abstract:
-                raise TypeError(
-                    'Multi-table inheritance of translatable models is not supported. '
-                    'Concrete model %s is not a valid base model for %s.' %
-                    (base._meta.model_name, model._meta.model_name)
-                )
-            # The base may have translations model, then just inherit that
-            if hasattr(base._meta, 'translations_model'):
-                bases.append(base._meta.translations_model)
-                fields.update(field.name for field in base._meta.translations_model._meta.fields)
-            else:
-                # But it may not, and simply inherit other abstract bases, scan them
-                scan_bases.extend(reversed(base.__bases__))
+        bases = list()
+        for base in model.__bases__:
+            for tmodel in self._scan_base(base, model):
+                if tmodel not in bases:     # diamond inheritance
+                    bases.append(tmodel)
+        fields = set(field.name for tmodel in bases for field in tmodel._meta.fields)
         bases.append(BaseTranslationModel)
         return bases, fields
 
+    @classmethod
+    def _scan_base(cls, base, model):
+        """ Return the translations models inherited through base, as a tuple.
+            Results for abstract bases that do not define translations are
+            cached on the base, so sibling and child models do not scan them again.
+        """
+        if base is TranslatableModel or not issubclass(base, TranslatableModel):
+            return ()
+        if not base._meta.abstract:
+            raise TypeError(
+                'Multi-table inheritance of translatable models is not supported. '
+                'Concrete model %s is not a valid base model for %s.' %
+                (base._meta.model_name, model._meta.model_name)
+            )
+        # The base may have translations model, then just inherit that
+        if hasattr(base._meta, 'translations_model'):
+            return (base._meta.translations_model,)
+
+        # But it may not, and simply inherit other abstract bases, scan them
+        try:
+            return base.__dict__['_hvad_scan_cache']
+        except KeyError:
+            pass
+        tmodels = list()
+        for parent in base.__bases__:
+            for tmodel in cls._scan_base(parent, model):
+                if tmodel not in tmodels:
+                    tmodels.append(tmodel)
+        base._hvad_scan_cache = tmodels = tuple(tmodels)
+        return tmodels
+
     def _build_meta_class(self, model, tfields):
         """ Create the Meta class for the translation model
             model -- the shared model
             tfields -- the list of names of all fields, direct and inherited
         """
+        tfields = frozenset(tfields)
         abstract = model._meta.abstract
         meta = self.meta.copy()
         meta.update({
@@ -155,9 +181,8 @@ class TranslatedFields(object):
         sconst, tconst = self._split_together(
             model._meta.unique_together, tfields, 'unique_together'
         )
-        model._meta.unique_together = tuple(sconst)
-        model._meta.original_attrs['unique_together'] = tuple(sconst)
-        meta['unique_together'] = tuple(tconst)
+        model._meta.unique_together = model._meta.original_attrs['unique_together'] = sconst
+        meta['unique_together'] = tconst
         if not abstract:
             meta['unique_together'] += (('language_code', 'master'),)
 
@@ -165,9 +190,8 @@ class TranslatedFields(object):
         sconst, tconst = self._split_together(
             model._meta.index_together, tfields, 'index_together'
         )
-        model._meta.index_together = tuple(sconst)
-        model._meta.original_attrs['index_together'] = tuple(sconst)
-        meta['index_together'] = tuple(tconst)
+        model._meta.index_together = model._meta.original_attrs['index_together'] = sconst
+        meta['index_together'] = tconst
 
         return type('Meta', (object,), meta)
 
@@ -196,31 +220,31 @@ class TranslatableModel(models.Model):
     """
     objects = TranslationManager()
     _plain_manager = models.Manager()
+    _hvad_translation = PendingTranslationAttribute()  # see SingleTranslationObject
 
     class Meta:
         abstract = True
         base_manager_name = '_plain_manager'
 
     def __init__(self, *args, **kwargs):
-        # Split arguments into shared/translatd
-        veto_names = ('pk', 'master', 'master_id', self._meta.translations_model._meta.pk.name)
+        # Split arguments into shared/translated
+        tnames, veto_names = self._hvad_translated_field_names, self._hvad_veto_names
         skwargs, tkwargs = {}, {}
-        translations_opts = self._meta.translations_model._meta
         for key, value in kwargs.items():
-            if key in veto_names:
-                skwargs[key] = value
+            if key in tnames and key not in veto_names:
+                tkwargs[key] = value
             else:
-                try:
-                    translations_opts.get_field(key)
-                except FieldDoesNotExist:
-                    skwargs[key] = value
-                else:
-                    tkwargs[key] = value
+                skwargs[key] = value
         super(TranslatableModel, self).__init__(*args, **skwargs)
         language_code = tkwargs.get('language_code') or get_language()
-        if language_code is not NoTranslation:
+        if language_code is NoTranslation:
+            self._hvad_translation = None
+        elif any(key != 'language_code' for key in tkwargs):
             tkwargs['language_code'] = language_code
-            set_cached_translation(self, self._meta.translations_model(**tkwargs))
+            self._hvad_translation = self._meta.translations_model(**tkwargs)
+        else:
+            # only the language is known, translation is built on first access
+            self._hvad_pending_translation = language_code
 
     @classmethod
     def from_db(cls, db, field_names, values):
@@ -230,43 +254,57 @@ class TranslatableModel(models.Model):
             values.reverse()
             values = [values.pop() if f.attname in field_names else models.DEFERRED
                     for f in cls._meta.concrete_fields]
-        new = cls(*values, language_code=NoTranslation)
+        new = cls._hvad_from_values(values)
         new._state.adding = False
         new._state.db = db
         return new
 
+    @classmethod
+    def _hvad_from_values(cls, values):
+        """ Build an instance from positional field values, with no translation loaded.
+            Skips the shared/translated argument split unless __init__ is overridden.
+        """
+        if cls.__init__ is not TranslatableModel.__init__:
+            return cls(*values, language_code=NoTranslation)
+        new = cls.__new__(cls)
+        # Run the rest of the MRO, so mixins placed after TranslatableModel are initialized
+        super(TranslatableModel, new).__init__(*values)
+        new._hvad_translation = None
+        return new
+
     def save(self, *args, **skwargs):
-        veto_names = ('pk', 'master', 'master_id', self._meta.translations_model._meta.pk.name)
-        translations_opts = self._meta.translations_model._meta
         translation = get_cached_translation(self)
         tkwargs = skwargs.copy()
 
         # split update_fields in shared/translated fields
         update_fields = skwargs.get('update_fields')
-        if update_fields is not None:
+        if update_fields is None:
+            save_shared, save_translation = True, translation is not None
+        else:
+            tnames, veto_names = self._hvad_translated_field_names, self._hvad_veto_names
             supdate, tupdate = [], []
             for name in update_fields:
-                if name in veto_names:
-                    supdate.append(name)
+                if name in tnames and name not in veto_names:
+                    tupdate.append(name)
                 else:
-                    try:
-                        translations_opts.get_field(name)
-                    except FieldDoesNotExist:
-                        supdate.append(name)
-                    else:
-                        tupdate.append(name)
+                    supdate.append(name)
             skwargs['update_fields'], tkwargs['update_fields'] = supdate, tupdate
-
-        # save share and translated model in a single transaction
-        db = router.db_for_write(self.__class__, instance=self)
-        with transaction.atomic(using=db, savepoint=False):
-            if update_fields is None or skwargs['update_fields']:
+            save_shared, save_translation = bool(supdate), bool(tupdate) and translation is not None
+            if save_translation and translation.pk is None:
+                del tkwargs['update_fields'] # allow new translations
+
+        if save_shared and save_translation:
+            # save shared and translated model in a single transaction
+            db = skwargs.get('using') or router.db_for_write(self.__class__, instance=self)
+            with transaction.atomic(using=db, savepoint=False):
                 super(TranslatableModel, self).save(*args, **skwargs)
-            if (update_fields is None or tkwargs['update_fields']) and translation is not None:
-                if translation.pk is None and update_fields:
-                    del tkwargs['update_fields'] # allow new translations
                 translation.master = self
                 translation.save(*args, **tkwargs)
+        elif save_shared:
+            super(TranslatableModel, self).save(*args, **skwargs)
+        elif save_translation:
+            translation.master = self
+            translation.save(*args, **tkwargs)
     save.alters_data = True
 
     def translate(self, language_code):
@@ -284,10 +322,13 @@ class TranslatableModel(models.Model):
     #===========================================================================
 
     def clean_fields(self, exclude=None):
-        super(TranslatableModel, self).clean_fields(exclude=exclude)
+        exclude = list(exclude) if exclude else []
+        # _hvad_query is a query-only field, it has no value on instances
+        super(TranslatableModel, self).clean_fields(exclude=exclude + ['_hvad_query'])
         translation = get_cached_translation(self)
         if translation is not None:
-            translation.clean_fields(exclude=exclude + ['id', 'master', 'master_id', 'language_code'])
+            exclude.extend(translation_clean_exclude)
+            translation.clean_fields(exclude=exclude)
 
     def validate_unique(self, exclude=None):
         super(TranslatableModel, self).validate_unique(exclude=exclude)
@@ -324,11 +365,12 @@ class TranslatableModel(models.Model):
     @classmethod
     def _check_default_manager_translation_aware(cls):
         errors = []
-        if not isinstance(cls._default_manager, TranslationManager):
+        if not getattr(cls._default_manager, '_is_translation_manager', False):
             errors.append(checks.Error(
                 "The default manager on a TranslatableModel must be a "
-                "TranslationManager instance or an instance of a subclass of "
-                "TranslationManager, the default manager of %r is not." % cls,
+                "TranslationManager instance, an instance of a subclass of "
+                "TranslationManager, or a manager with a true "
+                "_is_translation_manager attribute, the default manager of %r is not." % cls,
                 hint=None, obj=cls, id='hvad.models.E02'
             ))
         return errors
@@ -336,12 +378,7 @@ class TranslatableModel(models.Model):
     @classmethod
     def _check_local_fields(cls, fields, option):
         """ Remove fields we recognize as translated fields from tests """
-        to_check = []
-        for field in fields:
-            try:
-                cls._meta.translations_model._meta.get_field(field)
-            except FieldDoesNotExist:
-                to_check.append(field)
+        to_check = [f for f in fields if f not in cls._hvad_translated_field_names]
         return super(TranslatableModel, cls)._check_local_fields(to_check, option)
 
     @classmethod
@@ -390,32 +427,38 @@ def prepare_translatable_model(sender, **kwargs):
                                    "TranslatableModel must define TranslatedFields." % model)
 
     #### Now we have to work ####
+    translations_model = model._meta.translations_model
+    topts = translations_model._meta
 
     # Create query foreign object
-    if model._meta.proxy:
-        hvad_query = model._meta.concrete_model._meta.get_field('_hvad_query')
-    else:
-        hvad_query = SingleTranslationObject(model)
-        model.add_to_class('_hvad_query', hvad_query)
+    if not model._meta.proxy:
+        model.add_to_class('_hvad_query', SingleTranslationObject(model))
+
+    # Cache fields for argument routing, query translation and checks
+    model._hvad_translated_field_map = dict(chain.from_iterable(
+        ((f.name, f), (f.attname, f)) for f in chain(topts.fields, topts.many_to_many)
+    ))
+    model._hvad_translated_field_names = frozenset(model._hvad_translated_field_map)
+    model._hvad_veto_names = frozenset(('pk', 'master', 'master_id', topts.pk.name))
 
     # Set descriptors
-    ignore_fields = ('pk', 'master', 'master_id', 'language_code',
-                     model._meta.translations_model._meta.pk.name)
-    setattr(model, 'language_code', LanguageCodeAttribute(model, hvad_query))
-    for field in model._meta.translations_model._meta.fields:
+    ignore_fields = model._hvad_veto_names.union(('language_code',))
+    no_translation_error = type('NoTranslationError',
+                                (AttributeError, translations_model.DoesNotExist),
+                                {})
+    descriptors = {'language_code': LanguageCodeAttribute(model)}
+    for field in topts.fields:
         if field.name in ignore_fields:
             continue
-        setattr(model, field.name, TranslatedAttribute(model, field.name, hvad_query))
-        attname = field.get_attname()
+        descriptors[field.name] = TranslatedAttribute(model, field.name, no_translation_error)
+        attname = field.attname
         if attname and attname != field.name:
-            setattr(model, attname, TranslatedAttribute(model, attname, hvad_query))
+            descriptors[attname] = TranslatedAttribute(model, attname, no_translation_error)
+    for name, descriptor in descriptors.items():
+        setattr(model, name, descriptor)
 
-    # Replace get_field_by_name with one that warns for common mistakes
-    if not isinstance(model._meta.get_field, SmartGetField):
-        model._meta.get_field = MethodType(
-            SmartGetField(model._meta.get_field),
-            model._meta
-        )
+    # Replace get_field with one that warns for common mistakes
+    install_smart_options(model._meta)
 
 
 class_prepared.connect(prepare_translatable_model)
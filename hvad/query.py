@@ -30,16 +30,21 @@ def query_terms(model, path):
         if bit == 'pk': # handle 'pk' alias
             bit = model._meta.pk.name
 
+        tfields = getattr(model, '_hvad_translated_field_map', None)
         try:
-            try:                        # is field on the shared model?
-                field = model._meta.get_field.real(bit)
-                translated = False
-            except FieldDoesNotExist:   # nope, get field from translations model
-                field = model._meta.translations_model._meta.get_field(bit)
-                translated = True
-            except AttributeError:      # current model is a standard model
+            if tfields is None:         # current model is a standard model
                 field = model._meta.get_field(bit)
                 translated = False
+            elif bit in tfields and bit not in model._hvad_veto_names:
+                field = tfields[bit]    # common case: a translated field
+                translated = True
+            else:
+                try:                        # is field on the shared model?
+                    field = model._meta.real_get_field(bit)
+                    translated = False
+                except FieldDoesNotExist:   # nope, get field from translations model
+                    field = model._meta.translations_model._meta.get_field(bit)
+                    translated = True
             direct = (
                 not field.auto_created or
                 getattr(field, 'db_column', None) or
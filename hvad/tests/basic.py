@@ -3,7 +3,7 @@ from __future__ import with_statement
 import django
 from django.apps import apps
 from django.core import checks
-from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured, ValidationError
 from django.db import connection, models, IntegrityError
 from django.db.models.manager import Manager
 from django.db.models.query_utils import Q
@@ -15,7 +15,8 @@ from hvad.models import TranslatableModel, TranslatedFields
 from hvad.test_utils.data import NORMAL
 from hvad.test_utils.fixtures import NormalFixture
 from hvad.test_utils.testcase import HvadTestCase
-from hvad.test_utils.project.app.models import Normal, Unique, Related, MultipleFields, Boolean, Standard
+from hvad.test_utils.project.app.models import (Normal, Unique, Related, MultipleFields, Boolean,
+                                              Standard, TranslatedMany)
 from copy import deepcopy
 
 
@@ -90,6 +91,16 @@ class DefinitionTests(HvadTestCase):
         errors = InvalidModel.check()
         self.assertEqual(len(errors), 1)
         self.assertEqual(errors[0].id, 'hvad.models.E02')
+
+    def test_flagged_manager(self):
+        class FlaggedManager(Manager):
+            _is_translation_manager = True
+        class FlaggedManagerModel(TranslatableModel):
+            translations = TranslatedFields(
+                translated=models.CharField(max_length=250)
+            )
+            object = FlaggedManager()
+        self.assertFalse(FlaggedManagerModel.check())
     
     def test_no_translated_fields(self):
         with self.assertRaises(ImproperlyConfigured):
@@ -118,6 +129,18 @@ class DefinitionTests(HvadTestCase):
                                    obj=InvalidOrderingModel, id='models.E014'),
                       InvalidOrderingModel.check())
 
+    def test_ordering_late_fields(self):
+        class LateFieldsModel(TranslatableModel):
+            translations = TranslatedFields(
+                field=models.CharField(max_length=50),
+            )
+            class Meta:
+                ordering = ('tree_id', 'lft', 'field')
+        # fields added after class creation, as tree libraries do
+        LateFieldsModel.add_to_class('tree_id', models.PositiveIntegerField(default=0))
+        LateFieldsModel.add_to_class('lft', models.PositiveIntegerField(default=0))
+        self.assertFalse([error for error in LateFieldsModel.check() if error.id == 'models.E015'])
+
     def test_multi_table_raises(self):
         with self.assertRaises(TypeError):
             class InvalidModel3(Normal):
@@ -258,6 +281,48 @@ class DefinitionTests(HvadTestCase):
         model = type('MyBaseModel', (TranslatableModel,), attrs)
         self.assertTrue(model._meta.abstract)
 
+    def test_diamond_abstract_model(self):
+        class DiamondBase(TranslatableModel):
+            translations = TranslatedFields(
+                tfield_base=models.CharField(max_length=250),
+            )
+            class Meta:
+                abstract = True
+        class DiamondLeft(DiamondBase):
+            sfield_left = models.CharField(max_length=250)
+            class Meta:
+                abstract = True
+        class DiamondRight(DiamondBase):
+            sfield_right = models.CharField(max_length=250)
+            class Meta:
+                abstract = True
+        class DiamondModel(DiamondLeft, DiamondRight):
+            translations = TranslatedFields(
+                tfield=models.CharField(max_length=250),
+            )
+        translations_model = DiamondModel._meta.translations_model
+        self.assertEqual(translations_model.__bases__.count(DiamondBase._meta.translations_model), 1)
+        self.assertEqual(set(f.name for f in translations_model._meta.fields),
+                         set(('id', 'tfield_base', 'tfield', 'language_code', 'master')))
+
+    def test_from_db_mixin_init(self):
+        class InitMixin(models.Model):
+            def __init__(self, *args, **kwargs):
+                super(InitMixin, self).__init__(*args, **kwargs)
+                self.mixin_initialized = True
+            class Meta:
+                abstract = True
+        class MixinInitModel(TranslatableModel, InitMixin):
+            sfield = models.CharField(max_length=250)
+            translations = TranslatedFields(
+                tfield=models.CharField(max_length=250),
+            )
+        field_names = [f.attname for f in MixinInitModel._meta.concrete_fields]
+        obj = MixinInitModel.from_db('default', field_names, (1, 'shared'))
+        self.assertTrue(obj.mixin_initialized)
+        self.assertEqual(obj.sfield, 'shared')
+        self.assertIs(obj.translations.active, None)
+
     def test_custom_base_model(self):
         class CustomTranslation(models.Model):
             def test(self):
@@ -293,6 +358,7 @@ class OptionsTest(HvadTestCase):
         self.assertEqual(Normal._meta.translations_accessor, 'translations')
         self.assertRaises(FieldDoesNotExist, Normal._meta.get_field, 'inexistent_field')
         self.assertRaises(WrongManager, Normal._meta.get_field, 'translated_field')
+        self.assertRaises(WrongManager, TranslatedMany._meta.get_field, 'many')
         self.assertIs(Normal._meta.get_field(Normal._meta.translations_accessor).field.model,
                       Normal._meta.translations_model)
 
@@ -500,6 +566,16 @@ class CreateTest(HvadTestCase):
             self.assertEqual(en.translated_field, "English")
             self.assertEqual(en.language_code, "en")
         
+    def test_create_instance_language_at_init(self):
+        with translation.override('ja'):
+            obj = Normal(shared_field="shared", translated_field="Japanese")
+        with translation.override('en'):
+            obj.save()
+        ja = Normal.objects.language('ja').get(pk=obj.pk)
+        self.assertEqual(ja.translated_field, "Japanese")
+        self.assertEqual(ja.language_code, "ja")
+        self.assertFalse(Normal.objects.language('en').filter(pk=obj.pk).exists())
+
     def test_create_instance_shared_nolang(self):
         with translation.override('en'):
             obj = Normal(language_code='en', shared_field = "shared")
@@ -546,6 +622,13 @@ class CreateTest(HvadTestCase):
             )
 
 
+class WriteRecordingRouter(object):
+    calls = []
+    def db_for_write(self, model, **hints):
+        WriteRecordingRouter.calls.append((model, hints.get('instance')))
+        return None
+
+
 class UpdateTest(HvadTestCase, NormalFixture):
     normal_count = 2
 
@@ -589,6 +672,39 @@ class UpdateTest(HvadTestCase, NormalFixture):
         self.assertEqual(obj.shared_field, NORMAL[1].shared_field)
         self.assertEqual(obj.translated_field, 'update_translated')
 
+    def test_write_routing(self):
+        obj = Normal.objects.language('en').get(pk=self.normal_id[1])
+        with self.settings(DATABASE_ROUTERS=['hvad.tests.basic.WriteRecordingRouter']):
+            WriteRecordingRouter.calls = []
+            obj.save()
+            self.assertIn((Normal, obj), WriteRecordingRouter.calls)
+
+            WriteRecordingRouter.calls = []
+            obj.save(using='default')
+            self.assertEqual(WriteRecordingRouter.calls, [])
+
+    def test_update_fields_empty(self):
+        obj = Normal.objects.language('en').get(pk=self.normal_id[1])
+        obj.shared_field = 'update_shared'
+        obj.translated_field = 'update_translated'
+        with self.assertNumQueries(0):
+            obj.save(update_fields=[])
+        obj = Normal.objects.language().get(pk=self.normal_id[1])
+        self.assertEqual(obj.shared_field, NORMAL[1].shared_field)
+        self.assertEqual(obj.translated_field, NORMAL[1].translated_field['en'])
+
+
+class ValidationTest(HvadTestCase):
+    def test_clean_fields(self):
+        obj = Normal(language_code='en', shared_field='shared', translated_field='x' * 256)
+        with self.assertRaises(ValidationError) as cm:
+            obj.clean_fields()
+        self.assertEqual(list(cm.exception.message_dict), ['translated_field'])
+        obj.clean_fields(exclude=['translated_field'])
+
+        obj.translated_field = 'translated'
+        obj.clean_fields()
+
 
 class DeleteTest(HvadTestCase, NormalFixture):
     normal_count = 2
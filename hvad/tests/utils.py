@@ -5,6 +5,7 @@ from hvad.test_utils.data import NORMAL
 from hvad.test_utils.fixtures import NormalFixture
 from hvad.test_utils.testcase import HvadTestCase
 from hvad.test_utils.project.app.models import Normal, NormalProxy
+from copy import copy
 
 
 class TranslationRaterTests(HvadTestCase):
@@ -49,6 +50,39 @@ class TranslationAccessorTests(HvadTestCase, NormalFixture):
         with self.assertNumQueries(0):
             self.assertEqual(get_cached_translation(obj).language_code, 'en')
 
+    def test_pending_translation(self):
+        obj = Normal(language_code='ja', shared_field='shared')
+        self.assertNotIn('_hvad_translation', obj.__dict__)
+        with self.assertNumQueries(0):
+            translation = get_cached_translation(obj)
+        self.assertIsInstance(translation, Normal._meta.translations_model)
+        self.assertEqual(translation.language_code, 'ja')
+        self.assertIs(get_cached_translation(obj), translation)
+
+        obj = Normal(language_code='ja', shared_field='shared', translated_field='translated')
+        self.assertIn('_hvad_translation', obj.__dict__)
+        self.assertEqual(get_cached_translation(obj).translated_field, 'translated')
+        duplicate = copy(obj)
+        self.assertIs(get_cached_translation(duplicate), get_cached_translation(obj))
+
+        obj = Normal(language_code='ja', shared_field='shared')
+        set_cached_translation(obj, None)
+        self.assertIs(get_cached_translation(obj), None)
+
+        obj = Normal.objects.untranslated().get(pk=self.normal_id[1])
+        self.assertIn('_hvad_translation', obj.__dict__)
+        self.assertIs(get_cached_translation(obj), None)
+
+    def test_pending_translation_no_language(self):
+        with translation.override(None):
+            obj = Normal(shared_field='shared')
+            self.assertIsNot(get_cached_translation(obj), None)
+            obj.translated_field = 'translated'
+            self.assertEqual(get_cached_translation(obj).translated_field, 'translated')
+
+            obj = Normal(shared_field='shared', translated_field='translated')
+            self.assertIsNot(get_cached_translation(obj), None)
+
     def test_get_translation(self):
         # no translation loaded
         obj = Normal.objects.untranslated().get(pk=self.normal_id[1])
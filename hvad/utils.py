@@ -48,7 +48,7 @@ def get_cached_translation(instance):
         Intended for internal use and third-party modules.
         User code should use instance.translations.active instead.
     """
-    return instance._meta.get_field('_hvad_query').get_cached_value(instance, None)
+    return instance._hvad_translation
 
 def set_cached_translation(instance, translation):
     """ Sets the translation cached onto instance.
@@ -57,13 +57,8 @@ def set_cached_translation(instance, translation):
         - Passing None unsets the translation cache
         - Returns the translation that was loaded before
     """
-    hvad_query = instance._meta.get_field('_hvad_query')
-    previous = hvad_query.get_cached_value(instance, None)
-    if translation is None:
-        if previous is not None:
-            hvad_query.delete_cached_value(instance)
-    else:
-        hvad_query.set_cached_value(instance, translation)
+    previous = instance._hvad_translation
+    instance._hvad_translation = translation
     return previous
 
 def get_translation(instance, language_code=None):
@@ -105,22 +100,41 @@ def load_translation(instance, language, enforce=False):
 
 #=============================================================================
 
-class SmartGetField(object):
-    ''' Smart get_field that raises a helpful exception on get_field() '''
-    def __init__(self, real):
-        assert not isinstance(real, SmartGetField)
-        self.real = real
+class SmartOptions(object):
+    ''' Options mixin with a smart get_field that raises a helpful exception
+        when a translated field is looked up on the shared model.
+    '''
+    def real_get_field(self, field_name):
+        ''' Django's get_field, only looking up fields on the shared model '''
+        return super(SmartOptions, self).get_field(field_name)
 
-    def __call__(self, meta, name, *args, **kwargs):
+    def get_field(self, field_name):
         try:
-            return self.real(name, *args, **kwargs)
+            return super(SmartOptions, self).get_field(field_name)
         except FieldDoesNotExist as e:
-            try:
-                meta.translations_model._meta.get_field(name, *args, **kwargs)
-            except FieldDoesNotExist:
-                raise e
-            else:
-                raise WrongManager(meta, name)
+            if field_name not in self.model._hvad_translated_field_map:
+                try:    # reverse relations are not in the map
+                    self.translations_model._meta.get_field(field_name)
+                except FieldDoesNotExist:
+                    raise e
+            raise WrongManager(self, field_name)
+
+_smart_options_classes = {}
+
+def install_smart_options(meta):
+    ''' Turn given model options into SmartOptions, by switching its class
+        to a subclass of its current class. Subclasses are created only once.
+    '''
+    options_class = meta.__class__
+    if issubclass(options_class, SmartOptions):
+        return
+    try:
+        smart_class = _smart_options_classes[options_class]
+    except KeyError:
+        smart_class = _smart_options_classes[options_class] = type(
+            'Smart%s' % options_class.__name__, (SmartOptions, options_class), {}
+        )
+    meta.__class__ = smart_class
 
 #=============================================================================
 # Internal sugar